@@ -6,6 +6,60 @@
  * Chinese-English Dictionary. See https://github.com/alfons/PinyinStrictSort/wiki for details.
  */
 
+const orderedChars =
+  '0123456789aāáǎàAĀÁǍÀbBcCdDeēéěèEĒÉĚÈfFgGhHiīíǐìIĪÍǏÌ' +
+  'jJkKlLmMnNoōóǒòOŌÓǑÒpPqQrRsStTuūúǔùUŪÚǓÙüǖǘǚǜÜǕǗǙǛvVwWxXyYzZ\'- ';
+
+const WEIGHTS = {};
+for (let i = 0; i < orderedChars.length; i++) {
+  WEIGHTS[orderedChars[i]] = i;
+}
+const OFFSET = orderedChars.length;
+
+/**
+ * Map a string to its sequence of sort weights.
+ * @param {string} s - String to weigh.
+ * @returns {number[]} - One weight per character.
+ */
+function pinyinWeights(s) {
+  return Array.from(s, c => (WEIGHTS[c] !== undefined ? WEIGHTS[c] : c.charCodeAt(0) + OFFSET));
+}
+
+/**
+ * Build the sort key of a Pīnyīn string, computed once per item.
+ * @param {string} w - Pīnyīn string.
+ * @returns {{lower: number[], orig: number[]}} - Lowercase weights and original-case weights.
+ */
+function pinyinKey(w) {
+  const lowerW = w.toLowerCase();
+  const lower = pinyinWeights(lowerW);
+  return { lower, orig: lowerW === w ? lower : pinyinWeights(w) };
+}
+
+/**
+ * Compare two weight sequences element by element, shorter prefix first.
+ * @param {number[]} seq1 - First weight sequence.
+ * @param {number[]} seq2 - Second weight sequence.
+ * @returns {number} - Negative if seq1 < seq2, positive if seq1 > seq2, zero if equal.
+ */
+function compareWeights(seq1, seq2) {
+  const len = Math.min(seq1.length, seq2.length);
+  for (let i = 0; i < len; i++) {
+    if (seq1[i] !== seq2[i]) return seq1[i] - seq2[i];
+  }
+  return seq1.length - seq2.length;
+}
+
+/**
+ * Compare two Pīnyīn sort keys: lowercase first (tones intact), original case as tiebreaker.
+ * @param {{lower: number[], orig: number[]}} k1 - First key from pinyinKey.
+ * @param {{lower: number[], orig: number[]}} k2 - Second key from pinyinKey.
+ * @returns {number} - Negative if k1 < k2, positive if k1 > k2, zero if equal.
+ */
+function comparePinyinKeys(k1, k2) {
+  return compareWeights(k1.lower, k2.lower) || compareWeights(k1.orig, k2.orig);
+}
+
 /**
  * Compare two Pīnyīn strings for strict alphabetical ordering.
  * @param {string} w1 - First Pīnyīn string.
@@ -13,36 +67,7 @@
  * @returns {number} - Negative if w1 < w2, positive if w1 > w2, zero if equal.
  */
 function comparePinyin(w1, w2) {
-  const orderedChars =
-    '0123456789aāáǎàAĀÁǍÀbBcCdDeēéěèEĒÉĚÈfFgGhHiīíǐìIĪÍǏÌ' +
-    'jJkKlLmMnNoōóǒòOŌÓǑÒpPqQrRsStTuūúǔùUŪÚǓÙüǖǘǚǜÜǕǗǙǛvVwWxXyYzZ\'- ';
-
-  const WEIGHTS = {};
-  for (let i = 0; i < orderedChars.length; i++) {
-    WEIGHTS[orderedChars[i]] = i;
-  }
-  const OFFSET = orderedChars.length;
-
-  // Step 1: Compare lowercase versions first (tones intact)
-  const lowerW1 = w1.toLowerCase();
-  const lowerW2 = w2.toLowerCase();
-  const seq1Lower = Array.from(lowerW1).map(c => (WEIGHTS[c] !== undefined ? WEIGHTS[c] : c.charCodeAt(0) + OFFSET));
-  const seq2Lower = Array.from(lowerW2).map(c => (WEIGHTS[c] !== undefined ? WEIGHTS[c] : c.charCodeAt(0) + OFFSET));
-
-  const lenLower = Math.min(seq1Lower.length, seq2Lower.length);
-  for (let i = 0; i < lenLower; i++) {
-    if (seq1Lower[i] !== seq2Lower[i]) return seq1Lower[i] - seq2Lower[i];
-  }
-  if (seq1Lower.length !== seq2Lower.length) return seq1Lower.length - seq2Lower.length;
-
-  // Step 2: Tiebreaker with original case
-  const seq1Orig = Array.from(w1).map(c => (WEIGHTS[c] !== undefined ? WEIGHTS[c] : c.charCodeAt(0) + OFFSET));
-  const seq2Orig = Array.from(w2).map(c => (WEIGHTS[c] !== undefined ? WEIGHTS[c] : c.charCodeAt(0) + OFFSET));
-  const lenOrig = Math.min(seq1Orig.length, seq2Orig.length);
-  for (let i = 0; i < lenOrig; i++) {
-    if (seq1Orig[i] !== seq2Orig[i]) return seq1Orig[i] - seq2Orig[i];
-  }
-  return seq1Orig.length - seq2Orig.length;
+  return comparePinyinKeys(pinyinKey(w1), pinyinKey(w2));
 }
 
 /**
@@ -59,8 +84,9 @@ function comparePinyin(w1, w2) {
  */
 function pinyinStrictSort(items, key = null, reverse = false) {
   const extractor = typeof key === 'string' ? x => x[key] : (key || (x => x));
-  const sorted = [...items];
-  sorted.sort((a, b) => comparePinyin(extractor(a), extractor(b)));
+  const decorated = Array.from(items, item => ({ item, sortKey: pinyinKey(extractor(item)) }));
+  decorated.sort((a, b) => comparePinyinKeys(a.sortKey, b.sortKey));
+  const sorted = decorated.map(d => d.item);
   return reverse ? sorted.reverse() : sorted;
 }
 
@@ -0,0 +1,62 @@
+"""Strict alphabetical sorting for Hànyǔ Pīnyīn words (fast)
+
+Strict alphabetical sorting for strings, or dictionaries, letter by letter, 
+treating tone marks as integral to letters (e.g., a < ā < á < ǎ < à). 
+
+See https://github.com/alfons/PinyinStrictSort for details.
+"""
+from functools import lru_cache
+
+_ORDERED_CHARS = "0123456789aāáǎàbcdeēéěèfghiīíǐìjklmnoōóǒòpqrsstuūúǔùüǖǘǚǜvwxyz'- "
+_WEIGHTS = {char: i for i, char in enumerate(_ORDERED_CHARS)}
+
+# Translation table that renumbers code points so plain string comparison
+# follows _WEIGHTS: Pīnyīn characters first, then all other characters in
+# Unicode order. Code points from _TABLE_END upwards already sort behind
+# everything and pass through unchanged.
+_TABLE_END = max(map(ord, _ORDERED_CHARS)) + 1
+_OTHERS = [cp for cp in range(_TABLE_END) if chr(cp) not in _WEIGHTS]
+_TABLE = {ord(c): i for i, c in enumerate(sorted(_WEIGHTS, key=_WEIGHTS.get))}
+_TABLE.update({cp: i for i, cp in enumerate(_OTHERS, len(_TABLE))})
+
+def _sort_key(w):
+    """Return the sort key of a Pīnyīn string, computed once per item."""
+    lower = w.lower()
+    lower_key = lower.translate(_TABLE)
+    return lower_key, lower_key if lower == w else w.translate(_TABLE)
+
+def pinyin_strict_sort(items, key=None, reverse=False, copy=True, cache=False):
+    """Sort Pīnyīn strings or dictionaries alphabetically.
+
+    With copy=False, a list is sorted in place and returned instead of copied.
+    With cache=True, repeated words share one sort key; faster only when the
+    input has many duplicates.
+    """
+    sort_key = lru_cache(maxsize=None)(_sort_key) if cache else _sort_key
+    items_list = list(items) if copy or not isinstance(items, list) else items
+    items_list.sort(key=(lambda x: sort_key(x[key])) if key else sort_key, reverse=reverse)
+    return items_list
+
+
+"""
+# Sort strings
+words = ["bǎozhàng", "Bǎoyǔ", "bǎoyù"]
+pinyin_strict_sort(words)
+
+# Sort dictionaries
+dicts = [
+    {"pinyin": "bǎozhàng", "meaning": "guarantee"},
+    {"pinyin": "Bǎoyǔ", "meaning": "Bao Yu (name)"},
+    {"pinyin": "bǎoyù", "meaning": "jade"}
+]
+pinyin_strict_sort(dicts, key="pinyin")
+
+# Reverse order
+pinyin_strict_sort(words, reverse=True)
+
+# Sort a list in place
+pinyin_strict_sort(words, copy=False)
+
+# Share sort keys between repeated words
+pinyin_strict_sort(words, cache=True)
+"""